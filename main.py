@@ -4,13 +4,19 @@ BotMuteKit - Bot Discord para monitoramento automático de canais de voz
 Ponto de entrada principal da aplicação
 """
 
+from src.utils.startup import startup_timer
+
 import asyncio
 import signal
 import sys
+from typing import Optional
+import discord
 from src.config.logging import setup_logging
 from src.config.settings import BotSettings
 from src.bot.client import BotMuteKitClient
 
+startup_timer.mark("import")
+
 # Configura logging
 logger = setup_logging()
 
@@ -20,6 +26,7 @@ class BotRunner:
     def __init__(self):
         self.bot = None
         self.shutdown_event = asyncio.Event()
+        self.benchmark_task = None
     
     async def start_bot(self):
         """Inicia o bot"""
@@ -65,12 +72,63 @@ class BotRunner:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
     
-    async def run(self):
-        """Executa o bot com gerenciamento de ciclo de vida"""
+    async def _run_startup_benchmark(self, bot_task: asyncio.Task, timeout: float, output: str) -> str:
+        """
+        Aguarda a reconciliação e a primeira movimentação (cada espera limitada ao timeout),
+        grava o detalhamento da inicialização e encerra o bot
+        
+        Args:
+            bot_task: Tarefa que executa o bot
+            timeout: Tempo máximo de cada espera em segundos
+            output: Arquivo JSONL onde o resultado é acrescentado
+        
+        Returns:
+            Situação gravada: "ok", "timeout" ou "bot_stopped" (token ausente, falha no login)
+        """
+        loop = asyncio.get_running_loop()
+        status = "ok"
+        
+        deadline = loop.time() + timeout
+        while not startup_timer.has_phase("reconciliation"):
+            if bot_task.done():
+                status = "bot_stopped"
+                break
+            if loop.time() >= deadline:
+                status = "timeout"
+                break
+            await asyncio.sleep(0.1)
+        
+        if status == "ok":
+            deadline = loop.time() + timeout
+            while (startup_timer.first_enforcement is None and 
+                   not bot_task.done() and 
+                   loop.time() < deadline):
+                await asyncio.sleep(0.5)
+        
+        startup_timer.save(output, status)
+        self.shutdown_event.set()
+        return status
+    
+    async def run(self, benchmark_timeout: Optional[float] = None, benchmark_output: str = "startup_benchmark.jsonl") -> Optional[str]:
+        """
+        Executa o bot com gerenciamento de ciclo de vida
+        
+        Args:
+            benchmark_timeout: Se definido, encerra após medir a inicialização
+            benchmark_output: Arquivo onde o resultado do benchmark é acrescentado
+        
+        Returns:
+            Situação do benchmark de inicialização ou None se não foi executado
+        """
         try:
             # Inicia o bot em background
             bot_task = asyncio.create_task(self.start_bot())
             
+            if benchmark_timeout is not None:
+                self.benchmark_task = asyncio.create_task(
+                    self._run_startup_benchmark(bot_task, benchmark_timeout, benchmark_output)
+                )
+            
             # Aguarda pelo evento de shutdown
             await self.shutdown_event.wait()
             
@@ -92,16 +150,38 @@ class BotRunner:
         except Exception as e:
             logger.error(f"❌ Erro durante execução: {e}")
             await self.shutdown_bot()
+        
+        if self.benchmark_task is None:
+            return None
+        if not self.benchmark_task.done():
+            # Shutdown por sinal antes do fim da medição
+            self.benchmark_task.cancel()
+            return "interrupted"
+        return self.benchmark_task.result()
 
-async def main():
+async def main(benchmark_timeout: Optional[float] = None) -> Optional[str]:
     """Função principal"""
     runner = BotRunner()
-    await runner.run()
+    return await runner.run(benchmark_timeout)
+
+def run_transition_benchmark():
+    """Mede a vazão do classificador de transições de estado de voz"""
+    from src.services.voice_transitions import benchmark_classify
+    
+    events_per_second = benchmark_classify()
+    logger.info(f"⏱️ Classificador de transições: {events_per_second:,.0f} eventos/s")
 
 if __name__ == "__main__":
+    if "--transition-benchmark" in sys.argv:
+        run_transition_benchmark()
+        sys.exit(0)
+    
     try:
-        # Executa o bot
-        asyncio.run(main())
+        # Executa o bot (--startup-benchmark encerra após medir a inicialização)
+        benchmark_timeout = BotSettings.STARTUP_BENCHMARK_TIMEOUT if "--startup-benchmark" in sys.argv else None
+        benchmark_status = asyncio.run(main(benchmark_timeout))
+        if benchmark_status not in (None, "ok"):
+            sys.exit(1)
     except KeyboardInterrupt:
         logger.info("🛑 Bot interrompido pelo usuário")
     except Exception as e:
@@ -1,10 +1,15 @@
 """
 Cliente Discord principal do bot
 """
+import asyncio
 import logging
+import signal
 import discord
 from ..config.settings import BotSettings
+from ..services.event_queue import VoiceEventQueue
+from ..services.memory_monitor import MemoryMonitor
 from ..services.voice_monitor import VoiceMonitor
+from ..utils.startup import startup_timer
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +21,83 @@ class BotMuteKitClient(discord.Client):
         super().__init__(intents=intents)
         
         self.voice_monitor = VoiceMonitor()
+        self.event_queue = None
+        if BotSettings.EVENT_QUEUE_WORKERS > 0:
+            self.event_queue = VoiceEventQueue(
+                self.voice_monitor,
+                workers=BotSettings.EVENT_QUEUE_WORKERS,
+                max_size=BotSettings.EVENT_QUEUE_MAX_SIZE
+            )
+        self.memory_monitor = MemoryMonitor(
+            interval=BotSettings.MEMORY_REPORT_INTERVAL,
+            alarm_mb=BotSettings.MEMORY_ALARM_MB,
+            use_tracemalloc=BotSettings.MEMORY_TRACEMALLOC,
+            cleanup_interval=BotSettings.CLEANUP_INTERVAL
+        )
+        self._register_memory_sources()
+        self.event_stream = None
         
         logger.info("🤖 Cliente BotMuteKit inicializado")
     
+    async def setup_hook(self):
+        """Executado após o login, antes da conexão com o gateway"""
+        startup_timer.mark("login")
+        
+        self.memory_monitor.start()
+        
+        if self.event_queue:
+            self.event_queue.start()
+        
+        if BotSettings.EVENT_STREAM_PORT:
+            # Importado sob demanda: aiohttp.web só é necessário com o stream ativo
+            from ..services.event_stream import EventStreamServer
+            
+            try:
+                self.event_stream = EventStreamServer(
+                    self.voice_monitor.event_hub,
+                    token=BotSettings.EVENT_STREAM_TOKEN,
+                    host=BotSettings.EVENT_STREAM_HOST,
+                    port=BotSettings.EVENT_STREAM_PORT
+                )
+                await self.event_stream.start()
+            except (OSError, ValueError) as e:
+                logger.error(f"❌ Erro ao iniciar stream de eventos: {e}")
+                self.event_stream = None
+        
+        # SIGUSR1 grava um snapshot do tracemalloc sob demanda
+        if hasattr(signal, "SIGUSR1"):
+            try:
+                asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, self.memory_monitor.dump_snapshot)
+            except (NotImplementedError, RuntimeError):
+                pass
+    
+    def _register_memory_sources(self):
+        """Registra as estruturas contabilizadas no relatório de memória"""
+        for name, size_func in self.voice_monitor.get_memory_sources().items():
+            self.memory_monitor.register(name, size_func)
+        
+        self.memory_monitor.register("cache_guilds", lambda: len(self.guilds))
+        self.memory_monitor.register("cache_users", lambda: len(self.users))
+        self.memory_monitor.register("cache_members", lambda: sum(len(guild.members) for guild in self.guilds))
+        self.memory_monitor.register("cache_messages", lambda: len(self.cached_messages))
+        self.memory_monitor.register("event_queue_depth", lambda: self.event_queue.get_stats()["depth"] if self.event_queue else 0)
+        self.memory_monitor.register_cleanup(self.voice_monitor.cleanup)
+    
     async def on_ready(self):
         """Evento disparado quando o bot se conecta com sucesso"""
+        startup_timer.mark("gateway_ready")
+        
+        # Define o status em paralelo para não atrasar a reconciliação
+        presence_task = asyncio.create_task(self._set_bot_presence())
+        
+        for guild in self.guilds:
+            self.voice_monitor.rebuild_occupancy(guild)
+            self.voice_monitor.rebuild_exemptions(guild)
+            # Cede o loop entre servidores para o status e eventos serem processados
+            await asyncio.sleep(0)
+        
+        startup_timer.mark("reconciliation")
+        
         logger.info(f"✅ Bot conectado como {self.user}")
         logger.info(f"📊 Bot está em {len(self.guilds)} servidores")
         
@@ -34,9 +111,10 @@ class BotMuteKitClient(discord.Client):
         logger.info(f"🚪 Timeout para entrar mutado: {BotSettings.JOIN_MUTED_TIMEOUT} segundos")
         logger.info(f"🔄 Timeout para retornar mutado: {BotSettings.RETURN_MUTED_TIMEOUT} segundos")
         
-        await self._set_bot_presence()
+        await presence_task
         
         logger.info("🚀 Bot está pronto para monitorar canais de voz!")
+        startup_timer.report()
     
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
         """
@@ -47,7 +125,55 @@ class BotMuteKitClient(discord.Client):
             before: Estado anterior
             after: Estado atual
         """
-        await self.voice_monitor.handle_voice_state_update(member, before, after)
+        if self.event_queue:
+            self.event_queue.submit(member, before, after)
+        else:
+            await self.voice_monitor.handle_voice_state_update(member, before, after)
+    
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        """Atualiza a isenção do membro quando seus cargos mudam"""
+        if before.roles != after.roles:
+            self.voice_monitor.update_member_exemption(after)
+    
+    async def on_member_remove(self, member: discord.Member):
+        """Remove o membro que saiu do servidor do índice de isenções"""
+        self.voice_monitor.exemptions.remove_member(member)
+    
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Recompila as isenções quando um cargo é renomeado"""
+        if before.name != after.name:
+            self.voice_monitor.rebuild_exemptions(after.guild)
+    
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Recompila as isenções quando um cargo é removido"""
+        self.voice_monitor.rebuild_exemptions(role.guild)
+    
+    async def on_guild_role_create(self, role: discord.Role):
+        """Recompila as isenções quando um cargo é criado"""
+        self.voice_monitor.rebuild_exemptions(role.guild)
+    
+    async def on_guild_join(self, guild: discord.Guild):
+        """Indexa um servidor recém-adicionado"""
+        self.voice_monitor.rebuild_occupancy(guild)
+        self.voice_monitor.rebuild_exemptions(guild)
+    
+    async def on_guild_available(self, guild: discord.Guild):
+        """Indexa um servidor que ficou disponível após o READY"""
+        # Durante a inicialização o evento dispara para todos os servidores; o on_ready já os indexa
+        if not self.is_ready():
+            return
+        
+        self.voice_monitor.rebuild_occupancy(guild)
+        self.voice_monitor.rebuild_exemptions(guild)
+    
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Descarta a ocupação e as isenções de um servidor removido"""
+        self.voice_monitor.occupancy.remove_guild(guild.id)
+        self.voice_monitor.exemptions.remove_guild(guild)
+    
+    async def on_guild_unavailable(self, guild: discord.Guild):
+        """Descarta a ocupação de um servidor indisponível (reconstruída quando voltar)"""
+        self.voice_monitor.occupancy.remove_guild(guild.id)
     
     async def on_error(self, event, *args, **kwargs):
         """Trata erros gerais do bot"""
@@ -84,14 +210,23 @@ class BotMuteKitClient(discord.Client):
         """
         return {
             "guilds": len(self.guilds),
-            "voice_monitor": self.voice_monitor.get_stats()
+            "voice_monitor": self.voice_monitor.get_stats(),
+            "event_queue": self.event_queue.get_stats() if self.event_queue else None,
+            "memory": self.memory_monitor.get_stats()
         }
     
     async def shutdown(self):
         """Desliga o bot de forma limpa"""
         logger.info("🛑 Desligando bot...")
         
+        if self.event_queue:
+            self.event_queue.stop()
+        
         self.voice_monitor.shutdown()
+        self.memory_monitor.stop()
+        
+        if self.event_stream:
+            await self.event_stream.stop()
         
         await self.close()
         
@@ -16,11 +16,36 @@ class BotSettings:
     JOIN_MUTED_TIMEOUT = int(os.getenv("JOIN_MUTED_TIMEOUT", "5"))
     RETURN_MUTED_TIMEOUT = int(os.getenv("RETURN_MUTED_TIMEOUT", "20"))  # Timeout para retornar mutado
     
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RECOVERY_TIMEOUT = int(os.getenv("CIRCUIT_RECOVERY_TIMEOUT", "30"))
+    
+    RETURN_TRACKING_TTL = int(os.getenv("RETURN_TRACKING_TTL", "3600"))  # Tempo que uma saída continua contando como retorno
+    
+    MEMORY_REPORT_INTERVAL = int(os.getenv("MEMORY_REPORT_INTERVAL", "300"))
+    CLEANUP_INTERVAL = int(os.getenv("CLEANUP_INTERVAL", "300"))  # Limpeza de tarefas concluídas e retornos expirados
+    MEMORY_ALARM_MB = int(os.getenv("MEMORY_ALARM_MB", "0"))
+    MEMORY_TRACEMALLOC = os.getenv("MEMORY_TRACEMALLOC", "false").lower() in ("1", "true", "yes")
+    
+    EVENT_STREAM_PORT = int(os.getenv("EVENT_STREAM_PORT", "0"))  # 0 desativa o stream de eventos
+    EVENT_STREAM_HOST = os.getenv("EVENT_STREAM_HOST", "127.0.0.1")
+    EVENT_STREAM_TOKEN = os.getenv("EVENT_STREAM_TOKEN", "")  # Obrigatório para ativar o stream
+    EVENT_STREAM_BUFFER = int(os.getenv("EVENT_STREAM_BUFFER", "256"))
+    EVENT_STREAM_MAX_SUBSCRIBERS = int(os.getenv("EVENT_STREAM_MAX_SUBSCRIBERS", "100"))
+    
+    EVENT_QUEUE_WORKERS = int(os.getenv("EVENT_QUEUE_WORKERS", "4"))  # 0 processa os eventos no próprio dispatch
+    EVENT_QUEUE_MAX_SIZE = int(os.getenv("EVENT_QUEUE_MAX_SIZE", "1000"))  # Eventos pendentes por servidor
+    
+    STARTUP_BENCHMARK_TIMEOUT = int(os.getenv("STARTUP_BENCHMARK_TIMEOUT", "60"))  # Espera pela primeira movimentação no --startup-benchmark
+    
     AFK_CHANNEL_NAME = os.getenv("AFK_CHANNEL_NAME", "ausente")
     
     MONITORED_CHANNELS = os.getenv("MONITORED_CHANNELS", "").split(",") if os.getenv("MONITORED_CHANNELS") else []
     MONITORED_CHANNELS = [channel.strip().lower() for channel in MONITORED_CHANNELS if channel.strip()]
     
+    # Isenções: nomes/IDs de cargos e IDs de usuários; prefixe com "id_do_servidor:" para valer em um único servidor
+    EXEMPT_ROLES = [entry.strip() for entry in os.getenv("EXEMPT_ROLES", "").split(",") if entry.strip()]
+    EXEMPT_USERS = [entry.strip() for entry in os.getenv("EXEMPT_USERS", "").split(",") if entry.strip()]
+    
     @classmethod
     def validate(cls) -> bool:
         """Valida se as configurações obrigatórias estão presentes"""
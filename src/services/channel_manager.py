@@ -6,6 +6,7 @@ from typing import Optional
 import discord
 from ..config.settings import BotSettings
 from ..utils.helpers import sanitize_channel_name
+from .circuit_breaker import CircuitBreaker, RetryableRequestError
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,10 @@ class ChannelManager:
     
     def __init__(self):
         self.afk_channel_name = BotSettings.AFK_CHANNEL_NAME
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=BotSettings.CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=BotSettings.CIRCUIT_RECOVERY_TIMEOUT
+        )
     
     async def find_or_create_afk_channel(self, guild: discord.Guild) -> Optional[discord.VoiceChannel]:
         """
@@ -24,6 +29,9 @@ class ChannelManager:
         
         Returns:
             Canal AFK ou None se não for possível criar
+        
+        Raises:
+            RetryableRequestError: Se o Discord estiver instável
         """
         afk_channel = self._find_afk_channel(guild)
         
@@ -33,6 +41,8 @@ class ChannelManager:
         try:
             afk_channel = await self._create_afk_channel(guild)
             return afk_channel
+        except RetryableRequestError:
+            raise
         except discord.Forbidden:
             logger.error(f"❌ Sem permissão para criar canal '{self.afk_channel_name}'")
             return None
@@ -67,7 +77,8 @@ class ChannelManager:
         """
         sanitized_name = sanitize_channel_name(self.afk_channel_name)
         
-        afk_channel = await guild.create_voice_channel(
+        afk_channel = await self.circuit_breaker.call(
+            guild.create_voice_channel,
             name=sanitized_name,
             reason="Canal criado automaticamente pelo bot para usuários ausentes"
         )
@@ -85,23 +96,28 @@ class ChannelManager:
         
         Returns:
             True se o usuário foi movido com sucesso, False caso contrário
+        
+        Raises:
+            RetryableRequestError: Se o Discord estiver instável e a movimentação puder ser repetida
         """
         try:
             guild = member.guild
             afk_channel = await self.find_or_create_afk_channel(guild)
             
             if not afk_channel:
-                await member.move_to(None)
+                await self.circuit_breaker.call(member.move_to, None)
                 logger.info(f"🚪 {member.name} foi removido do canal '{original_channel.name}' por ficar com áudio desativado")
                 return True
             
             if afk_channel != original_channel:
-                await member.move_to(afk_channel)
+                await self.circuit_breaker.call(member.move_to, afk_channel)
                 logger.info(f"🔄 {member.name} foi movido de '{original_channel.name}' para '{afk_channel.name}' por ficar com áudio desativado")
                 return True
             
             return False
             
+        except RetryableRequestError:
+            raise
         except Exception as e:
             logger.error(f"❌ Erro ao mover usuário {member.name} para canal AFK: {e}")
             return False
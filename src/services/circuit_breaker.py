@@ -0,0 +1,190 @@
+"""
+Circuit breaker para as chamadas REST ao Discord
+"""
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional
+import aiohttp
+import discord
+
+logger = logging.getLogger(__name__)
+
+class RetryableRequestError(Exception):
+    """Falha transitória do Discord; a operação pode ser tentada novamente"""
+
+class CircuitOpenError(RetryableRequestError):
+    """O circuito está aberto e a requisição não foi enviada"""
+
+class CircuitBreaker:
+    """
+    Interrompe as requisições após falhas consecutivas (5xx, timeouts, erros de conexão)
+    e libera uma requisição de teste após o tempo de recuperação
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        request_timeout: Optional[float] = None,
+        backoff_base: float = 2.0,
+        backoff_max: float = 120.0
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.request_timeout = request_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_in_flight = False
+
+        self.total_calls = 0
+        self.total_failures = 0
+        self.total_rejected = 0
+        self.times_opened = 0
+
+    @staticmethod
+    def is_transient(error: Exception) -> bool:
+        """
+        Verifica se um erro indica instabilidade do Discord
+
+        Args:
+            error: Exceção levantada pela requisição
+
+        Returns:
+            True para 5xx, timeouts e erros de conexão
+        """
+        if isinstance(error, discord.HTTPException):
+            return error.status >= 500
+        return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError, OSError))
+
+    def _before_call(self) -> bool:
+        """
+        Verifica se a requisição pode ser enviada
+
+        Returns:
+            True se a requisição for uma sonda do estado semiaberto
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                self.total_rejected += 1
+                raise CircuitOpenError("Circuito aberto para requisições ao Discord")
+            self.state = self.HALF_OPEN
+            logger.info("🟡 Circuito semiaberto, enviando requisição de teste ao Discord")
+
+        if self.state == self.HALF_OPEN:
+            if self.probe_in_flight:
+                self.total_rejected += 1
+                raise CircuitOpenError("Circuito semiaberto aguardando requisição de teste")
+            self.probe_in_flight = True
+            return True
+
+        return False
+
+    def _record_success(self) -> None:
+        """Registra uma requisição bem-sucedida"""
+        if self.state != self.CLOSED:
+            logger.info("🟢 Circuito fechado, requisições ao Discord normalizadas")
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def _record_failure(self) -> None:
+        """Registra uma falha transitória"""
+        self.total_failures += 1
+        self.consecutive_failures += 1
+
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                logger.warning(
+                    f"🔴 Circuito aberto após {self.consecutive_failures} falhas consecutivas, "
+                    f"pausando requisições por {self.recovery_timeout}s"
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    async def call(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Executa uma requisição através do circuito
+
+        Args:
+            func: Função assíncrona a ser executada
+            *args: Argumentos posicionais
+            **kwargs: Argumentos nomeados
+
+        Returns:
+            Resultado da função
+
+        Raises:
+            CircuitOpenError: Se o circuito estiver aberto
+            RetryableRequestError: Se a requisição falhar de forma transitória
+        """
+        is_probe = self._before_call()
+        self.total_calls += 1
+
+        try:
+            if self.request_timeout is None:
+                # Sem timeout próprio: o discord.py aguarda rate limits (429) dentro da chamada,
+                # e essa espera não deve contar como falha do Discord
+                result = await func(*args, **kwargs)
+            else:
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout=self.request_timeout)
+        except Exception as e:
+            if not self.is_transient(e):
+                # Erros do cliente (4xx) não indicam instabilidade do Discord
+                if is_probe:
+                    self._record_success()
+                raise
+            self._record_failure()
+            raise RetryableRequestError(str(e) or type(e).__name__) from e
+        finally:
+            if is_probe:
+                self.probe_in_flight = False
+
+        self._record_success()
+        return result
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """
+        Calcula o atraso até a próxima tentativa com backoff exponencial e jitter
+
+        Args:
+            attempt: Número da tentativa (começando em 0)
+
+        Returns:
+            Atraso em segundos
+        """
+        # Limita o expoente para evitar OverflowError em indisponibilidades longas
+        delay = min(self.backoff_max, self.backoff_base * (2 ** min(attempt, 16)))
+        delay = random.uniform(delay / 2, delay)
+
+        if self.state == self.OPEN and self.opened_at is not None:
+            remaining = self.recovery_timeout - (time.monotonic() - self.opened_at)
+            delay = max(delay, remaining + random.uniform(0, self.backoff_base))
+
+        return delay
+
+    def get_stats(self) -> dict:
+        """
+        Retorna o estado e os contadores do circuito
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "total_calls": self.total_calls,
+            "total_failures": self.total_failures,
+            "total_rejected": self.total_rejected,
+            "times_opened": self.times_opened
+        }
@@ -0,0 +1,125 @@
+"""
+Distribuição de eventos do monitoramento para assinantes (ex.: painéis ao vivo)
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+class EventSubscriber:
+    """Assinante com buffer circular limitado; eventos antigos são descartados se não consumir a tempo"""
+
+    def __init__(self, buffer_size: int):
+        self.buffer = deque(maxlen=buffer_size)
+        self.dropped = 0
+        self._ready = asyncio.Event()
+
+    def push(self, payload: str) -> None:
+        """
+        Enfileira um evento já serializado sem bloquear
+
+        Args:
+            payload: Evento em JSON
+        """
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append(payload)
+        self._ready.set()
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda novos eventos
+
+        Args:
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            True se houver eventos, False se o tempo esgotou
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def drain(self) -> List[str]:
+        """
+        Retira todos os eventos pendentes
+
+        Returns:
+            Lista de eventos em JSON
+        """
+        events = list(self.buffer)
+        self.buffer.clear()
+        self._ready.clear()
+        return events
+
+class EventHub:
+    """Publica eventos para vários assinantes sem nunca bloquear quem publica"""
+
+    def __init__(self, buffer_size: int = 256, max_subscribers: int = 100):
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self.subscribers: Set[EventSubscriber] = set()
+        self.published = 0
+
+    def subscribe(self) -> Optional[EventSubscriber]:
+        """
+        Cria um novo assinante
+
+        Returns:
+            Assinante ou None se o limite de assinantes foi atingido
+        """
+        if len(self.subscribers) >= self.max_subscribers:
+            return None
+
+        subscriber = EventSubscriber(self.buffer_size)
+        self.subscribers.add(subscriber)
+        logger.debug(f"📡 Novo assinante de eventos ({len(self.subscribers)} ativos)")
+        return subscriber
+
+    def unsubscribe(self, subscriber: EventSubscriber) -> None:
+        """
+        Remove um assinante
+
+        Args:
+            subscriber: Assinante a ser removido
+        """
+        self.subscribers.discard(subscriber)
+        logger.debug(f"📡 Assinante de eventos removido ({len(self.subscribers)} ativos)")
+
+    def publish(self, event_type: str, **data) -> None:
+        """
+        Publica um evento para todos os assinantes
+
+        Args:
+            event_type: Tipo do evento (deafen, timer_armed, moved, cancelled, ...)
+            **data: Campos do evento
+        """
+        if not self.subscribers:
+            return
+
+        data["type"] = event_type
+        data["timestamp"] = time.time()
+        payload = json.dumps(data, ensure_ascii=False)
+
+        self.published += 1
+        for subscriber in self.subscribers:
+            subscriber.push(payload)
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas da distribuição de eventos
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        return {
+            "subscribers": len(self.subscribers),
+            "published": self.published,
+            "dropped": sum(subscriber.dropped for subscriber in self.subscribers)
+        }
@@ -0,0 +1,219 @@
+"""
+Fila de ingestão de eventos de voz, desacoplada do dispatch do gateway
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Dict, List, Optional
+import discord
+from .voice_monitor import VoiceMonitor
+from .voice_transitions import CANCELLING_KINDS
+
+logger = logging.getLogger(__name__)
+
+class VoiceEventRecord:
+    """Registro leve de uma transição de voz aguardando processamento"""
+
+    __slots__ = ("member", "kind", "channel", "seq", "enqueued_at")
+
+    def __init__(self, member: discord.Member, kind: str, channel: Optional[discord.VoiceChannel], seq: int):
+        self.member = member
+        self.kind = kind
+        self.channel = channel
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+
+class GuildEventQueue:
+    """Fila limitada de um servidor, com prioridade para eventos que cancelam timers"""
+
+    __slots__ = ("high", "low", "scheduled")
+
+    def __init__(self):
+        self.high = deque()  # ativou o áudio, saiu do canal
+        self.low = deque()   # desativou o áudio, entrou/mudou de canal com áudio desativado
+        self.scheduled = False
+
+    def __len__(self) -> int:
+        return len(self.high) + len(self.low)
+
+    def pop(self) -> VoiceEventRecord:
+        """Retira o próximo evento, priorizando os que cancelam timers"""
+        return self.high.popleft() if self.high else self.low.popleft()
+
+class VoiceEventQueue:
+    """
+    Recebe eventos do gateway sem aguardar o processamento e os distribui
+    para um pequeno grupo de workers, um servidor por vez
+    """
+
+    def __init__(self, voice_monitor: VoiceMonitor, workers: int = 4, max_size: int = 1000):
+        self.voice_monitor = voice_monitor
+        self.worker_count = workers
+        self.max_size = max_size
+
+        self.guild_queues: Dict[int, GuildEventQueue] = {}
+        self._ready: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._seq = 0
+        # member_id -> sequência do evento mais recente enfileirado
+        self._latest_seq: Dict[int, int] = {}
+
+        self.enqueued = 0
+        self.processed = 0
+        self.shed = 0
+        self.superseded = 0
+        self.max_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def start(self) -> None:
+        """Inicia os workers"""
+        if self._workers:
+            return
+
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.worker_count)
+        ]
+        logger.info(f"📥 Fila de eventos iniciada com {self.worker_count} workers")
+
+    def stop(self) -> None:
+        """Interrompe os workers e descarta eventos pendentes"""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers.clear()
+        self.guild_queues.clear()
+        self._latest_seq.clear()
+
+    def submit(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
+        """
+        Classifica e enfileira uma mudança de estado de voz sem bloquear
+
+        Args:
+            member: Membro cujo estado mudou
+            before: Estado anterior
+            after: Estado atual
+        """
+        transition = self.voice_monitor.ingest(member, before, after)
+        if transition is None:
+            return
+
+        kind, channel = transition
+        self._seq += 1
+        record = VoiceEventRecord(member, kind, channel, self._seq)
+
+        guild_id = member.guild.id
+        queue = self.guild_queues.get(guild_id)
+        if queue is None:
+            queue = self.guild_queues[guild_id] = GuildEventQueue()
+
+        if len(queue) >= self.max_size and not self._shed(queue, record):
+            return
+
+        self._latest_seq[member.id] = record.seq
+        if kind in CANCELLING_KINDS:
+            queue.high.append(record)
+        else:
+            queue.low.append(record)
+
+        self.enqueued += 1
+        depth = len(queue)
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+        if not queue.scheduled:
+            queue.scheduled = True
+            self._ready.put_nowait(guild_id)
+
+    def _shed(self, queue: GuildEventQueue, record: VoiceEventRecord) -> bool:
+        """
+        Libera espaço em uma fila cheia
+
+        Descarta primeiro o evento de armar timer mais antigo (na dúvida o usuário
+        não é movido); só descarta eventos de cancelamento se a fila tiver apenas eles.
+
+        Returns:
+            True se o novo evento deve ser enfileirado
+        """
+        self.shed += 1
+
+        if queue.low:
+            self._forget(queue.low.popleft())
+            return True
+
+        if record.kind not in CANCELLING_KINDS:
+            return False
+
+        self._forget(queue.high.popleft())
+        return True
+
+    def _forget(self, record: VoiceEventRecord) -> None:
+        """Remove a sequência de um evento descartado se ele era o mais recente do membro"""
+        if self._latest_seq.get(record.member.id) == record.seq:
+            del self._latest_seq[record.member.id]
+
+    async def _worker(self) -> None:
+        """Processa eventos de um servidor por vez, alternando entre servidores"""
+        while True:
+            guild_id = await self._ready.get()
+            queue = self.guild_queues.get(guild_id)
+
+            if queue is None or not queue:
+                if queue is not None:
+                    queue.scheduled = False
+                continue
+
+            record = queue.pop()
+            await self._process(record)
+
+            if queue:
+                # Volta para o fim da fila para não monopolizar os workers
+                self._ready.put_nowait(guild_id)
+            else:
+                queue.scheduled = False
+                del self.guild_queues[guild_id]
+
+    async def _process(self, record: VoiceEventRecord) -> None:
+        """
+        Executa a transição, ignorando armações já superadas por eventos mais novos
+
+        Cancelamentos atrasados ainda são executados; o UserManager só os aplica ao
+        timer armado no mesmo servidor, então não afetam um timer de outro servidor.
+        Saídas atrasadas só cancelam o timer: o rastreamento de retorno já foi feito
+        na ordem do gateway em VoiceMonitor.ingest.
+        """
+        wait = time.monotonic() - record.enqueued_at
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+        member_id = record.member.id
+        is_latest = self._latest_seq.get(member_id) == record.seq
+        if is_latest:
+            del self._latest_seq[member_id]
+
+        if not is_latest and record.kind not in CANCELLING_KINDS:
+            self.superseded += 1
+            return
+
+        await self.voice_monitor.handle_transition(record.member, record.kind, record.channel)
+        self.processed += 1
+
+    def get_stats(self) -> dict:
+        """
+        Retorna métricas da fila
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        handled = self.processed + self.superseded
+        return {
+            "depth": sum(len(queue) for queue in self.guild_queues.values()),
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "superseded": self.superseded,
+            "shed": self.shed,
+            "avg_wait": self.total_wait / handled if handled else 0.0,
+            "max_wait": self.max_wait
+        }
@@ -0,0 +1,93 @@
+"""
+Endpoint Server-Sent Events para acompanhar o monitoramento ao vivo
+"""
+import hmac
+import logging
+from typing import Optional
+from aiohttp import web
+from .event_hub import EventHub
+
+logger = logging.getLogger(__name__)
+
+class EventStreamServer:
+    """
+    Servidor HTTP que expõe os eventos do EventHub em /events (SSE)
+
+    Exige o token compartilhado no cabeçalho "Authorization: Bearer <token>"
+    ou no parâmetro "?token=" (EventSource não permite cabeçalhos).
+    """
+
+    HEARTBEAT_INTERVAL = 15
+
+    def __init__(self, hub: EventHub, token: str, host: str = "127.0.0.1", port: int = 8080):
+        if not token:
+            raise ValueError("EVENT_STREAM_TOKEN é obrigatório para ativar o stream de eventos")
+
+        self.hub = hub
+        self.token = token
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        """Inicia o servidor no loop atual"""
+        app = web.Application()
+        app.router.add_get("/events", self._handle_events)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+        logger.info(f"📡 Stream de eventos disponível em http://{self.host}:{self.port}/events")
+
+    async def stop(self) -> None:
+        """Interrompe o servidor"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _is_authorized(self, request: web.Request) -> bool:
+        """Verifica o token compartilhado da requisição"""
+        header = request.headers.get("Authorization", "")
+        token = header[7:] if header.startswith("Bearer ") else request.query.get("token", "")
+        return hmac.compare_digest(token.encode(), self.token.encode())
+
+    async def _handle_events(self, request: web.Request) -> web.StreamResponse:
+        """Envia os eventos para um assinante enquanto a conexão estiver aberta"""
+        if not self._is_authorized(request):
+            return web.Response(status=401, text="Token inválido")
+
+        subscriber = self.hub.subscribe()
+        if subscriber is None:
+            return web.Response(status=503, text="Limite de assinantes atingido")
+
+        response = web.StreamResponse(headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache"
+        })
+
+        try:
+            await response.prepare(request)
+            reported_dropped = 0
+
+            while True:
+                if not await subscriber.wait(timeout=self.HEARTBEAT_INTERVAL):
+                    await response.write(b": heartbeat\n\n")
+                    continue
+
+                events = subscriber.drain()
+
+                if subscriber.dropped != reported_dropped:
+                    lost = subscriber.dropped - reported_dropped
+                    reported_dropped = subscriber.dropped
+                    await response.write(f"event: dropped\ndata: {lost}\n\n".encode())
+
+                chunk = "".join(f"data: {payload}\n\n" for payload in events)
+                await response.write(chunk.encode())
+
+        except (ConnectionResetError, ConnectionError):
+            pass
+        finally:
+            self.hub.unsubscribe(subscriber)
+
+        return response
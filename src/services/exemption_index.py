@@ -0,0 +1,159 @@
+"""
+Índice de membros isentos do monitoramento (por cargo ou por usuário)
+"""
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+import discord
+
+logger = logging.getLogger(__name__)
+
+def parse_exemption_rules(entries: List[str]) -> List[Tuple[Optional[int], str]]:
+    """
+    Converte entradas de configuração em regras (servidor, valor)
+
+    Entradas no formato "valor" valem para todos os servidores; "id_do_servidor:valor"
+    vale apenas para aquele servidor.
+
+    Args:
+        entries: Lista de entradas da configuração
+
+    Returns:
+        Lista de tuplas (ID do servidor ou None, valor em minúsculas)
+    """
+    rules = []
+    for entry in entries:
+        guild_part, separator, value = entry.partition(":")
+        if separator and guild_part.strip().isdigit():
+            rules.append((int(guild_part.strip()), value.strip().lower()))
+        else:
+            rules.append((None, entry.strip().lower()))
+    return [(guild_id, value) for guild_id, value in rules if value]
+
+class ExemptionIndex:
+    """
+    Mantém, por servidor, o conjunto de IDs de membros isentos, compilado a partir
+    dos cargos e usuários configurados e atualizado pelos eventos de membro
+    """
+
+    def __init__(self, role_rules: List[Tuple[Optional[int], str]], user_rules: List[Tuple[Optional[int], str]]):
+        self.role_rules = role_rules
+        self.user_rules = user_rules
+
+        # guild_id -> IDs dos cargos isentos resolvidos
+        self.exempt_roles: Dict[int, Set[int]] = {}
+        # guild_id -> IDs dos membros isentos por cargo
+        self.exempt_members: Dict[int, Set[int]] = {}
+        # guild_id -> IDs dos usuários isentos pela configuração (mantidos se saírem e voltarem)
+        self.exempt_users: Dict[int, Set[int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Indica se há alguma regra de isenção configurada"""
+        return bool(self.role_rules or self.user_rules)
+
+    def _rules_for(self, rules: List[Tuple[Optional[int], str]], guild_id: int) -> Set[str]:
+        """Retorna os valores das regras que se aplicam a um servidor"""
+        return {value for rule_guild, value in rules if rule_guild is None or rule_guild == guild_id}
+
+    def rebuild(self, guild: discord.Guild) -> None:
+        """
+        Recompila as isenções de um servidor
+
+        Args:
+            guild: Servidor Discord
+        """
+        if not self.enabled:
+            return
+
+        role_values = self._rules_for(self.role_rules, guild.id)
+        user_ids = {int(value) for value in self._rules_for(self.user_rules, guild.id) if value.isdigit()}
+
+        roles = {
+            role.id for role in guild.roles
+            if str(role.id) in role_values or role.name.lower() in role_values
+        }
+
+        members = set()
+        for role in guild.roles:
+            if role.id in roles:
+                members.update(member.id for member in role.members)
+
+        self.exempt_roles[guild.id] = roles
+        self.exempt_members[guild.id] = members
+        self.exempt_users[guild.id] = user_ids
+
+        logger.debug(f"🛡️ Isenções de {guild.name}: {len(roles)} cargos, {len(members)} membros, {len(user_ids)} usuários")
+
+    def update_member(self, member: discord.Member) -> bool:
+        """
+        Atualiza a isenção de um membro após mudança de cargos
+
+        Args:
+            member: Membro atualizado
+
+        Returns:
+            True se o membro está isento após a atualização
+        """
+        if not self.enabled:
+            return False
+
+        guild_id = member.guild.id
+        roles = self.exempt_roles.get(guild_id, set())
+        members = self.exempt_members.setdefault(guild_id, set())
+
+        if any(role.id in roles for role in member.roles):
+            members.add(member.id)
+        else:
+            members.discard(member.id)
+        return self.is_exempt(guild_id, member.id)
+
+    def remove_member(self, member: discord.Member) -> None:
+        """
+        Remove um membro que saiu do servidor (a isenção por ID configurada é mantida)
+
+        Args:
+            member: Membro removido
+        """
+        members = self.exempt_members.get(member.guild.id)
+        if members is not None:
+            members.discard(member.id)
+
+    def remove_guild(self, guild: discord.Guild) -> None:
+        """
+        Descarta as isenções de um servidor
+
+        Args:
+            guild: Servidor Discord
+        """
+        self.exempt_roles.pop(guild.id, None)
+        self.exempt_members.pop(guild.id, None)
+        self.exempt_users.pop(guild.id, None)
+
+    def is_exempt(self, guild_id: int, member_id: int) -> bool:
+        """
+        Verifica se um membro está isento
+
+        Args:
+            guild_id: ID do servidor
+            member_id: ID do membro
+
+        Returns:
+            True se o membro está isento
+        """
+        return (
+            member_id in self.exempt_users.get(guild_id, ()) or
+            member_id in self.exempt_members.get(guild_id, ())
+        )
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas das isenções
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        return {
+            "exempt_roles": sum(len(roles) for roles in self.exempt_roles.values()),
+            "exempt_members": sum(len(members) for members in self.exempt_members.values()),
+            "exempt_users": sum(len(users) for users in self.exempt_users.values())
+        }
@@ -0,0 +1,217 @@
+"""
+Serviço para contabilizar o uso de memória e detectar vazamentos
+"""
+import asyncio
+import logging
+import os
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+def get_rss_mb() -> Optional[float]:
+    """
+    Retorna a memória residente atual do processo em MB
+
+    Returns:
+        RSS em MB ou None se não for possível obter
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+        import sys
+        # ru_maxrss é o pico: KB no Linux, bytes no macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except (ImportError, OSError):
+        return None
+
+class MemoryMonitor:
+    """Reporta periodicamente o tamanho das estruturas internas e o uso de memória"""
+
+    def __init__(
+        self,
+        interval: int = 300,
+        alarm_mb: int = 0,
+        use_tracemalloc: bool = False,
+        snapshot_dir: str = ".",
+        cleanup_interval: int = 300
+    ):
+        self.interval = interval
+        self.cleanup_interval = cleanup_interval
+        self.alarm_mb = alarm_mb
+        self.use_tracemalloc = use_tracemalloc
+        self.snapshot_dir = snapshot_dir
+
+        self.sources: Dict[str, Callable[[], int]] = {}
+        self.cleanups: List[Callable[[], None]] = []
+        self.last_sizes: Dict[str, int] = {}
+        self.alarm_active = False
+        self._previous_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._task: Optional[asyncio.Task] = None
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, size_func: Callable[[], int]) -> None:
+        """
+        Registra uma estrutura a ser contabilizada
+
+        Args:
+            name: Nome exibido no relatório
+            size_func: Função que retorna o tamanho atual da estrutura
+        """
+        self.sources[name] = size_func
+
+    def register_cleanup(self, cleanup_func: Callable[[], None]) -> None:
+        """
+        Registra uma limpeza periódica, executada mesmo com o relatório desativado
+
+        Args:
+            cleanup_func: Função que descarta entradas obsoletas
+        """
+        self.cleanups.append(cleanup_func)
+
+    def start(self) -> None:
+        """Inicia o relatório e as limpezas periódicas"""
+        if self.use_tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            logger.info("🧠 tracemalloc ativado para rastreamento de memória")
+
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+        if self._cleanup_task is None and self.cleanup_interval > 0:
+            self._cleanup_task = asyncio.create_task(self._run_cleanups())
+
+    def stop(self) -> None:
+        """Interrompe o relatório e as limpezas periódicas"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
+
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._previous_snapshot = None
+
+    async def _run(self) -> None:
+        """Laço do relatório periódico"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.report()
+            except Exception as e:
+                logger.error(f"❌ Erro ao gerar relatório de memória: {e}")
+
+    async def _run_cleanups(self) -> None:
+        """Laço das limpezas periódicas"""
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            for cleanup_func in self.cleanups:
+                try:
+                    cleanup_func()
+                except Exception as e:
+                    logger.error(f"❌ Erro na limpeza periódica: {e}")
+
+    def collect(self) -> Dict[str, int]:
+        """
+        Coleta o tamanho atual de cada estrutura registrada
+
+        Returns:
+            Dicionário nome -> tamanho
+        """
+        sizes = {}
+        for name, size_func in self.sources.items():
+            try:
+                sizes[name] = size_func()
+            except Exception as e:
+                logger.debug(f"Não foi possível medir {name}: {e}")
+        return sizes
+
+    def report(self) -> Dict[str, int]:
+        """
+        Registra no log o tamanho das estruturas e verifica o limite de memória
+
+        Returns:
+            Tamanhos coletados
+        """
+        sizes = self.collect()
+        rss_mb = get_rss_mb()
+
+        details = ", ".join(
+            f"{name}: {size} ({size - self.last_sizes.get(name, size):+d})"
+            for name, size in sizes.items()
+        )
+        rss_text = f"{rss_mb:.1f} MB" if rss_mb is not None else "indisponível"
+        logger.info(f"🧠 Memória - RSS: {rss_text} | {details}")
+        self.last_sizes = sizes
+
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            self._log_snapshot_diff()
+
+        self._check_alarm(rss_mb)
+        return sizes
+
+    def _check_alarm(self, rss_mb: Optional[float]) -> None:
+        """Emite alerta quando o RSS ultrapassa o limite configurado"""
+        if not self.alarm_mb or rss_mb is None:
+            return
+
+        if rss_mb >= self.alarm_mb:
+            if not self.alarm_active:
+                self.alarm_active = True
+                logger.warning(f"🚨 Uso de memória {rss_mb:.1f} MB ultrapassou o limite de {self.alarm_mb} MB")
+                if self.use_tracemalloc:
+                    self.dump_snapshot()
+        elif self.alarm_active:
+            self.alarm_active = False
+            logger.info(f"✅ Uso de memória {rss_mb:.1f} MB voltou abaixo do limite de {self.alarm_mb} MB")
+
+    def _log_snapshot_diff(self, limit: int = 5) -> None:
+        """Registra as maiores variações de alocação desde o relatório anterior"""
+        snapshot = tracemalloc.take_snapshot()
+
+        if self._previous_snapshot is not None:
+            stats = snapshot.compare_to(self._previous_snapshot, "lineno")
+            for stat in stats[:limit]:
+                logger.info(f"🧠 {stat}")
+
+        self._previous_snapshot = snapshot
+
+    def dump_snapshot(self) -> Optional[str]:
+        """
+        Grava um snapshot do tracemalloc em disco
+
+        Returns:
+            Caminho do arquivo gravado ou None se o tracemalloc estiver desativado
+        """
+        if not tracemalloc.is_tracing():
+            logger.warning("⚠️ tracemalloc não está ativo, snapshot não gravado")
+            return None
+
+        path = os.path.join(self.snapshot_dir, f"memory-{int(time.time())}.snapshot")
+        tracemalloc.take_snapshot().dump(path)
+        logger.info(f"💾 Snapshot de memória gravado em {path}")
+        return path
+
+    def get_stats(self) -> dict:
+        """
+        Retorna o uso de memória e o tamanho atual das estruturas
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        return {
+            "rss_mb": get_rss_mb(),
+            "sizes": self.collect(),
+            "alarm_active": self.alarm_active
+        }
@@ -0,0 +1,174 @@
+"""
+Índice incremental de ocupação dos canais de voz
+"""
+import logging
+import time
+from typing import Dict, Optional, Tuple
+import discord
+
+logger = logging.getLogger(__name__)
+
+class ChannelOccupancy:
+    """Contadores de ocupação de um canal de voz"""
+
+    __slots__ = ("total", "deafened", "muted")
+
+    def __init__(self):
+        self.total = 0
+        self.deafened = 0
+        self.muted = 0
+
+    def as_dict(self) -> dict:
+        """Retorna os contadores como dicionário"""
+        return {"total": self.total, "deafened": self.deafened, "muted": self.muted}
+
+class VoiceOccupancyIndex:
+    """
+    Mantém contadores por canal (total, com áudio desativado, mutados) atualizados
+    a cada mudança de estado de voz, evitando percorrer `channel.members`
+
+    Os contadores consideram o estado próprio e o aplicado pelo servidor: com áudio
+    desativado é `self_deaf or deaf` e mutado é `self_mute or mute`.
+    """
+
+    def __init__(self):
+        self.channels: Dict[int, ChannelOccupancy] = {}
+        # member_id -> (guild_id, channel_id, deafened, muted)
+        self.members: Dict[int, Tuple[int, int, bool, bool]] = {}
+        # member_id -> instante (time.monotonic) em que desativou o áudio
+        self.deafened_since: Dict[int, float] = {}
+
+    def update(self, member_id: int, voice: Optional[discord.VoiceState]) -> None:
+        """
+        Aplica o estado de voz atual de um membro ao índice
+
+        Args:
+            member_id: ID do membro
+            voice: Estado de voz atual (None ou sem canal quando saiu)
+        """
+        channel = voice.channel if voice else None
+
+        if channel is None:
+            self._remove(member_id)
+            return
+
+        deafened = bool(voice.self_deaf or voice.deaf)
+        muted = bool(voice.self_mute or voice.mute)
+        new_state = (channel.guild.id, channel.id, deafened, muted)
+
+        old_state = self.members.get(member_id)
+        if old_state == new_state:
+            return
+
+        if old_state is not None:
+            self._discount(old_state)
+
+        occupancy = self.channels.get(channel.id)
+        if occupancy is None:
+            occupancy = self.channels[channel.id] = ChannelOccupancy()
+        occupancy.total += 1
+        occupancy.deafened += deafened
+        occupancy.muted += muted
+        self.members[member_id] = new_state
+
+        if deafened:
+            if old_state is None or not old_state[2]:
+                self.deafened_since[member_id] = time.monotonic()
+        else:
+            self.deafened_since.pop(member_id, None)
+
+    def _remove(self, member_id: int) -> None:
+        """Remove um membro do índice"""
+        old_state = self.members.pop(member_id, None)
+        if old_state is not None:
+            self._discount(old_state)
+        self.deafened_since.pop(member_id, None)
+
+    def _discount(self, state: Tuple[int, int, bool, bool]) -> None:
+        """Desconta um estado anterior dos contadores do canal"""
+        _, channel_id, deafened, muted = state
+        occupancy = self.channels.get(channel_id)
+        if occupancy is None:
+            return
+
+        occupancy.total -= 1
+        occupancy.deafened -= deafened
+        occupancy.muted -= muted
+
+        if occupancy.total <= 0:
+            del self.channels[channel_id]
+
+    def rebuild(self, guild: discord.Guild) -> None:
+        """
+        Reconstrói o índice de um servidor a partir de um snapshot completo
+
+        Args:
+            guild: Servidor Discord
+        """
+        # Descarta todo o servidor, inclusive membros de canais que foram removidos
+        self.remove_guild(guild.id)
+
+        for channel in (*guild.voice_channels, *guild.stage_channels):
+            for member in channel.members:
+                self.update(member.id, member.voice)
+
+        logger.debug(f"📇 Índice de ocupação reconstruído para {guild.name}")
+
+    def remove_guild(self, guild_id: int) -> None:
+        """
+        Descarta todas as entradas de um servidor
+
+        Args:
+            guild_id: ID do servidor
+        """
+        stale_members = [
+            member_id for member_id, state in self.members.items()
+            if state[0] == guild_id
+        ]
+        for member_id in stale_members:
+            self._remove(member_id)
+
+    def get(self, channel_id: int) -> Optional[ChannelOccupancy]:
+        """
+        Retorna a ocupação de um canal
+
+        Args:
+            channel_id: ID do canal
+
+        Returns:
+            Contadores do canal ou None se estiver vazio
+        """
+        return self.channels.get(channel_id)
+
+    def listening_count(self, channel_id: int) -> int:
+        """
+        Retorna quantos membros do canal estão com áudio ativado
+
+        Args:
+            channel_id: ID do canal
+
+        Returns:
+            Número de membros escutando
+        """
+        occupancy = self.channels.get(channel_id)
+        if occupancy is None:
+            return 0
+        return occupancy.total - occupancy.deafened
+
+    def get_deafened_since(self, member_id: int) -> Optional[float]:
+        """
+        Retorna desde quando um membro está com áudio desativado
+
+        Args:
+            member_id: ID do membro
+
+        Returns:
+            Instante (time.monotonic) ou None se não estiver com áudio desativado
+        """
+        return self.deafened_since.get(member_id)
+
+    def clear(self) -> None:
+        """Limpa todo o índice"""
+        self.channels.clear()
+        self.members.clear()
+        self.deafened_since.clear()
@@ -14,33 +14,62 @@ class UserManager:
     
     def __init__(self):
         self.muted_users: Dict[int, asyncio.Task] = {}
+        # user_id -> ID do servidor em que a tarefa foi armada
+        self.task_guilds: Dict[int, int] = {}
     
-    def add_muted_user(self, user_id: int, task: asyncio.Task) -> None:
+    def add_muted_user(self, user_id: int, task: asyncio.Task, guild_id: Optional[int] = None) -> None:
         """
         Adiciona um usuário mutado ao gerenciamento
         
         Args:
             user_id: ID do usuário
             task: Tarefa de timeout associada
+            guild_id: ID do servidor em que a tarefa foi armada
         """
         if user_id in self.muted_users:
             self.muted_users[user_id].cancel()
         
         self.muted_users[user_id] = task
+        if guild_id is None:
+            self.task_guilds.pop(user_id, None)
+        else:
+            self.task_guilds[user_id] = guild_id
         logger.debug(f"Usuário {user_id} adicionado ao gerenciamento de mute")
     
-    def remove_muted_user(self, user_id: int) -> None:
+    def remove_muted_user(self, user_id: int, guild_id: Optional[int] = None) -> None:
         """
         Remove um usuário mutado do gerenciamento
         
         Args:
             user_id: ID do usuário
+            guild_id: Se informado, só remove a tarefa armada neste servidor
         """
         if user_id in self.muted_users:
+            if guild_id is not None and self.task_guilds.get(user_id, guild_id) != guild_id:
+                logger.debug(f"Tarefa do usuário {user_id} pertence a outro servidor, mantida")
+                return
+            
             if not self.muted_users[user_id].done():
                 self.muted_users[user_id].cancel()
             
             del self.muted_users[user_id]
+            self.task_guilds.pop(user_id, None)
+            logger.debug(f"Usuário {user_id} removido do gerenciamento de mute")
+    
+    def discard_task(self, user_id: int, task: Optional[asyncio.Task]) -> None:
+        """
+        Remove o usuário do gerenciamento apenas se a tarefa registrada for a informada
+        
+        Usado pela própria tarefa ao terminar, para não remover uma tarefa mais nova
+        que já a substituiu (ex.: usuário mudou de canal com áudio desativado).
+        
+        Args:
+            user_id: ID do usuário
+            task: Tarefa que está finalizando
+        """
+        if self.muted_users.get(user_id) is task:
+            del self.muted_users[user_id]
+            self.task_guilds.pop(user_id, None)
             logger.debug(f"Usuário {user_id} removido do gerenciamento de mute")
     
     def cancel_user_task(self, user_id: int) -> None:
@@ -85,6 +114,7 @@ class UserManager:
         
         for user_id in completed_users:
             del self.muted_users[user_id]
+            self.task_guilds.pop(user_id, None)
         
         if completed_users:
             logger.debug(f"Removidas {len(completed_users)} tarefas concluídas")
@@ -96,4 +126,5 @@ class UserManager:
                 task.cancel()
         
         self.muted_users.clear()
+        self.task_guilds.clear()
         logger.info("Todas as tarefas de usuários foram canceladas")
@@ -3,12 +3,20 @@ Serviço principal para monitorar mudanças de estado de voz dos usuários
 """
 import asyncio
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 import discord
 from ..config.settings import BotSettings
 from ..utils.helpers import should_monitor_channel
+from ..utils.startup import startup_timer
 from .user_manager import UserManager
 from .channel_manager import ChannelManager
+from .circuit_breaker import RetryableRequestError
+from .event_hub import EventHub
+from .exemption_index import ExemptionIndex, parse_exemption_rules
+from .occupancy_index import ChannelOccupancy, VoiceOccupancyIndex
+from .voice_transitions import (
+    ARMING_KINDS, DEAFENED, JOINED_DEAFENED, LEFT, MOVED_DEAFENED, UNDEAFENED, classify_transition
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +26,36 @@ class VoiceMonitor:
     def __init__(self):
         self.user_manager = UserManager()
         self.channel_manager = ChannelManager()
+        self.event_hub = EventHub(
+            buffer_size=BotSettings.EVENT_STREAM_BUFFER,
+            max_subscribers=BotSettings.EVENT_STREAM_MAX_SUBSCRIBERS
+        )
+        self.occupancy = VoiceOccupancyIndex()
+        self.exemptions = ExemptionIndex(
+            parse_exemption_rules(BotSettings.EXEMPT_ROLES),
+            parse_exemption_rules(BotSettings.EXEMPT_USERS)
+        )
         self.mute_timeout = BotSettings.MUTE_TIMEOUT
         self.join_muted_timeout = BotSettings.JOIN_MUTED_TIMEOUT
         self.return_muted_timeout = BotSettings.RETURN_MUTED_TIMEOUT
         self.monitored_channels = BotSettings.MONITORED_CHANNELS
+        self.return_tracking_ttl = BotSettings.RETURN_TRACKING_TTL
         
         # Rastreia usuários que saíram de salas monitoradas
         self.users_left_monitored_channels = {}
+        
+        # Tarefas com movimentação adiada aguardando o Discord se estabilizar
+        # (por tarefa: um timer substituído não remove a entrada do timer novo)
+        self.pending_retries = set()
+        
+        # Tabela de despacho: tipo de transição -> handler(member, channel)
+        self._transition_handlers = {
+            DEAFENED: self._handle_audio_deactivated,
+            UNDEAFENED: self._handle_audio_activated,
+            MOVED_DEAFENED: self._handle_channel_change_muted,
+            JOINED_DEAFENED: self._handle_join_muted,
+            LEFT: self._handle_leave_channel,
+        }
     
     async def handle_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> None:
         """
@@ -35,25 +66,56 @@ class VoiceMonitor:
             before: Estado anterior
             after: Estado atual
         """
+        transition = self.ingest(member, before, after)
+        if transition is not None:
+            await self.handle_transition(member, *transition)
+    
+    def ingest(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState) -> Optional[Tuple[str, Optional[discord.VoiceChannel]]]:
+        """
+        Etapa síncrona e barata: atualiza o índice de ocupação, classifica a mudança,
+        registra saídas para o timeout de retorno e descarta transições que armariam
+        timer para membros isentos
+        
+        O rastreamento de retorno é feito aqui, na ordem do gateway, para que uma saída
+        processada depois da volta do membro (fila de outro servidor) não o registre.
+        
+        Args:
+            member: Membro cujo estado mudou
+            before: Estado anterior
+            after: Estado atual
+        
+        Returns:
+            Tupla (tipo de transição, canal) ou None se a mudança for irrelevante
+        """
         try:
-            if after.self_deaf and not before.self_deaf and after.channel:
-                await self._handle_audio_deactivated(member, after.channel)
+            self.occupancy.update(member.id, after)
+            transition = classify_transition(before, after)
             
-            elif not after.self_deaf and before.self_deaf:
-                await self._handle_audio_activated(member)
+            if transition is not None and transition[0] == LEFT:
+                self._track_leave(member, transition[1])
             
-            elif (after.channel and before.channel and 
-                  after.channel != before.channel and 
-                  after.self_deaf):
-                await self._handle_channel_change_muted(member, after.channel)
+            if (transition is not None and 
+                transition[0] in ARMING_KINDS and 
+                self.exemptions.is_exempt(member.guild.id, member.id)):
+                logger.debug(f"🛡️ {member.name} está isento do monitoramento")
+                return None
             
-            elif (after.channel and not before.channel and 
-                  after.self_deaf):
-                await self._handle_join_muted(member, after.channel)
-            
-            elif not after.channel and before.channel:
-                await self._handle_leave_channel(member)
-                
+            return transition
+        except Exception as e:
+            logger.error(f"❌ Erro ao processar mudança de estado de voz para {member.name}: {e}")
+            return None
+    
+    async def handle_transition(self, member: discord.Member, kind: str, channel: Optional[discord.VoiceChannel]) -> None:
+        """
+        Executa o handler de uma transição já classificada
+        
+        Args:
+            member: Membro cujo estado mudou
+            kind: Tipo de transição
+            channel: Canal relevante para a transição
+        """
+        try:
+            await self._transition_handlers[kind](member, channel)
         except Exception as e:
             logger.error(f"❌ Erro ao processar mudança de estado de voz para {member.name}: {e}")
     
@@ -64,24 +126,24 @@ class VoiceMonitor:
             return
         
         logger.info(f"🔇 {member.name} desativou o áudio no canal {channel.name}")
+        self._publish("deafen", member, channel)
         
-        task = asyncio.create_task(self._check_mute_timeout(member))
-        self.user_manager.add_muted_user(member.id, task)
+        self._arm_timer(member, channel, self.mute_timeout, "normal")
     
-    async def _handle_audio_activated(self, member: discord.Member) -> None:
+    async def _handle_audio_activated(self, member: discord.Member, channel: discord.VoiceChannel) -> None:
         """Processa quando um usuário ativa o áudio"""
         logger.info(f"🔊 {member.name} ativou o áudio")
-        self.user_manager.remove_muted_user(member.id)
+        self._cancel_timer(member, channel, "undeafen")
     
     async def _handle_channel_change_muted(self, member: discord.Member, new_channel: discord.VoiceChannel) -> None:
         """Processa quando um usuário muda de canal com áudio desativado"""
         if should_monitor_channel(new_channel, self.monitored_channels):
             logger.info(f"🔄 {member.name} mudou para {new_channel.name} com áudio desativado")
+            self._publish("deafen", member, new_channel)
             
-            task = asyncio.create_task(self._check_mute_timeout(member))
-            self.user_manager.add_muted_user(member.id, task)
+            self._arm_timer(member, new_channel, self.mute_timeout, "normal")
         else:
-            self.user_manager.remove_muted_user(member.id)
+            self._cancel_timer(member, new_channel, "unmonitored_channel")
             logger.debug(f"⏭️ {member.name} mudou para canal não monitorado: {new_channel.name}")
     
     async def _handle_join_muted(self, member: discord.Member, channel: discord.VoiceChannel) -> None:
@@ -102,24 +164,59 @@ class VoiceMonitor:
                 timeout_duration = self.join_muted_timeout
                 join_type = "join_muted"
             
-            task = asyncio.create_task(
-                self._check_mute_timeout(member, timeout_duration, join_type)
-            )
-            self.user_manager.add_muted_user(member.id, task)
+            self._publish("deafen", member, channel)
+            self._arm_timer(member, channel, timeout_duration, join_type)
         else:
             logger.debug(f"⏭️ Canal {channel.name} não está sendo monitorado")
     
     async def _handle_leave_channel(self, member: discord.Member, channel: discord.VoiceChannel) -> None:
-        """Processa quando um usuário sai do canal de voz"""
-        self.user_manager.remove_muted_user(member.id)
+        """Processa quando um usuário sai do canal de voz (o retorno é rastreado em ingest)"""
+        self._cancel_timer(member, channel, "leave")
+    
+    def _track_leave(self, member: discord.Member, channel: discord.VoiceChannel) -> None:
+        """Rastreia a saída de um canal monitorado para o timeout de retorno"""
+        if not should_monitor_channel(channel, self.monitored_channels):
+            return
         
-        # Se saiu de um canal monitorado, rastreia para timeout de retorno
-        if should_monitor_channel(channel, self.monitored_channels):
-            self.users_left_monitored_channels[member.id] = {
-                'channel_name': channel.name,
-                'timestamp': asyncio.get_event_loop().time()
-            }
-            logger.debug(f"📝 {member.name} saiu do canal monitorado {channel.name}, será rastreado para retorno")
+        self.users_left_monitored_channels[member.id] = {
+            'channel_name': channel.name,
+            'timestamp': asyncio.get_event_loop().time()
+        }
+        logger.debug(f"📝 {member.name} saiu do canal monitorado {channel.name}, será rastreado para retorno")
+    
+    def _arm_timer(self, member: discord.Member, channel: discord.VoiceChannel, timeout_duration: int, join_type: str) -> None:
+        """Agenda a verificação de timeout de um usuário com áudio desativado"""
+        task = asyncio.create_task(
+            self._check_mute_timeout(member, timeout_duration, join_type)
+        )
+        self.user_manager.add_muted_user(member.id, task, member.guild.id)
+        self._publish("timer_armed", member, channel, join_type=join_type, timeout=timeout_duration)
+    
+    def _cancel_timer(self, member: discord.Member, channel: discord.VoiceChannel, reason: str) -> None:
+        """Cancela a verificação de timeout pendente do usuário armada neste servidor"""
+        if not self.user_manager.is_user_muted(member.id):
+            return
+        
+        # Eventos atrasados de outro servidor não cancelam um timer armado depois
+        self.user_manager.remove_muted_user(member.id, member.guild.id)
+        if self.user_manager.is_user_muted(member.id):
+            return
+        
+        self._publish("cancelled", member, channel, reason=reason)
+    
+    def _publish(self, event_type: str, member: discord.Member, channel: Optional[discord.VoiceChannel] = None, **data) -> None:
+        """Publica um evento do monitoramento no stream ao vivo"""
+        if not self.event_hub.subscribers:
+            return
+        
+        self.event_hub.publish(
+            event_type,
+            guild_id=member.guild.id,
+            member_id=member.id,
+            member=member.name,
+            channel=channel.name if channel else None,
+            **data
+        )
     
     async def _check_mute_timeout(self, member: discord.Member, timeout_duration: Optional[int] = None, join_type: str = "normal") -> None:
         """
@@ -136,13 +233,10 @@ class VoiceMonitor:
             
             await asyncio.sleep(timeout_duration)
             
-            if (member.voice and 
-                member.voice.channel and 
-                member.voice.self_deaf):
-                
-                original_channel = member.voice.channel
-                
-                await self.channel_manager.move_user_to_afk(member, original_channel)
+            original_channel = await self._move_with_retry(member)
+            if original_channel is not None:
+                startup_timer.mark_first_enforcement()
+                self._publish("moved", member, original_channel, join_type=join_type, timeout=timeout_duration)
                 
                 if join_type == "return_muted":
                     logger.info(f"🔄 {member.name} foi movido por retornar mutado e ficar {timeout_duration} segundos")
@@ -151,13 +245,120 @@ class VoiceMonitor:
                 else:
                     logger.info(f"🔄 {member.name} foi movido por ficar com áudio desativado por {timeout_duration} segundos")
             
-            self.user_manager.remove_muted_user(member.id)
+            self.user_manager.discard_task(member.id, asyncio.current_task())
             
         except asyncio.CancelledError:
-            self.user_manager.remove_muted_user(member.id)
+            self.user_manager.discard_task(member.id, asyncio.current_task())
         except Exception as e:
             logger.error(f"❌ Erro ao verificar timeout para {member.name}: {e}")
-            self.user_manager.remove_muted_user(member.id)
+            self.user_manager.discard_task(member.id, asyncio.current_task())
+    
+    async def _move_with_retry(self, member: discord.Member) -> Optional[discord.VoiceChannel]:
+        """
+        Move o usuário para o canal AFK, aguardando com backoff enquanto o Discord estiver instável
+        
+        A tarefa continua registrada no UserManager durante as novas tentativas, então
+        ativar o áudio ou sair do canal cancela a movimentação pendente normalmente.
+        
+        Args:
+            member: Membro a ser movido
+        
+        Returns:
+            Canal de onde o usuário foi movido ou None se não foi movido
+        """
+        circuit_breaker = self.channel_manager.circuit_breaker
+        current_task = asyncio.current_task()
+        attempt = 0
+        
+        try:
+            while (member.voice and 
+                   member.voice.channel and 
+                   member.voice.self_deaf):
+                original_channel = member.voice.channel
+                try:
+                    moved = await self.channel_manager.move_user_to_afk(member, original_channel)
+                    return original_channel if moved else None
+                except RetryableRequestError as e:
+                    delay = circuit_breaker.get_retry_delay(attempt)
+                    attempt += 1
+                    self.pending_retries.add(current_task)
+                    logger.debug(f"⏳ Movimentação de {member.name} adiada por {delay:.1f}s (tentativa {attempt}): {e}")
+                    await asyncio.sleep(delay)
+            
+            return None
+        finally:
+            self.pending_retries.discard(current_task)
+    
+    def update_member_exemption(self, member: discord.Member) -> None:
+        """
+        Atualiza a isenção de um membro após mudança de cargos, cancelando o timer se ficou isento
+        
+        Args:
+            member: Membro atualizado
+        """
+        if self.exemptions.update_member(member):
+            self._cancel_timer(member, member.voice.channel if member.voice else None, "exempt")
+    
+    def rebuild_exemptions(self, guild: discord.Guild) -> None:
+        """
+        Recompila as isenções de um servidor
+        
+        Args:
+            guild: Servidor Discord
+        """
+        self.exemptions.rebuild(guild)
+    
+    def cleanup(self) -> None:
+        """Descarta tarefas concluídas e saídas antigas do rastreamento de retorno"""
+        self.user_manager.cleanup_completed_tasks()
+        
+        now = asyncio.get_event_loop().time()
+        expired = [
+            member_id for member_id, info in self.users_left_monitored_channels.items()
+            if now - info['timestamp'] > self.return_tracking_ttl
+        ]
+        for member_id in expired:
+            del self.users_left_monitored_channels[member_id]
+        
+        if expired:
+            logger.debug(f"Removidas {len(expired)} saídas expiradas do rastreamento de retorno")
+    
+    def get_memory_sources(self) -> dict:
+        """
+        Retorna funções que medem o tamanho das estruturas internas do monitor
+        
+        Returns:
+            Dicionário nome -> função de tamanho
+        """
+        return {
+            "timers": lambda: len(self.user_manager.muted_users),
+            "return_tracker": lambda: len(self.users_left_monitored_channels),
+            "pending_retries": lambda: len(self.pending_retries),
+            "occupancy_members": lambda: len(self.occupancy.members),
+            "occupancy_channels": lambda: len(self.occupancy.channels),
+            "event_subscribers": lambda: len(self.event_hub.subscribers),
+        }
+    
+    def get_channel_occupancy(self, channel: discord.VoiceChannel) -> Optional[ChannelOccupancy]:
+        """
+        Retorna a ocupação atual de um canal sem percorrer seus membros
+        
+        Args:
+            channel: Canal de voz
+        
+        Returns:
+            Contadores do canal ou None se estiver vazio
+        """
+        return self.occupancy.get(channel.id)
+    
+    def rebuild_occupancy(self, guild: discord.Guild) -> None:
+        """
+        Reconstrói o índice de ocupação de um servidor (usado na reconciliação)
+        
+        Args:
+            guild: Servidor Discord
+        """
+        self.occupancy.rebuild(guild)
     
     def get_stats(self) -> dict:
         """
@@ -168,6 +369,11 @@ class VoiceMonitor:
         """
         return {
             "monitored_users": self.user_manager.get_user_count(),
+            "occupied_channels": len(self.occupancy.channels),
+            "pending_retries": len(self.pending_retries),
+            "circuit_breaker": self.channel_manager.circuit_breaker.get_stats(),
+            "event_stream": self.event_hub.get_stats(),
+            "exemptions": self.exemptions.get_stats(),
             "mute_timeout": self.mute_timeout,
             "join_muted_timeout": self.join_muted_timeout,
             "return_muted_timeout": self.return_muted_timeout,
@@ -177,4 +383,5 @@ class VoiceMonitor:
     def shutdown(self) -> None:
         """Desliga o monitoramento e cancela todas as tarefas"""
         self.user_manager.shutdown()
+        self.occupancy.clear()
         logger.info("Monitor de voz desligado")
@@ -0,0 +1,101 @@
+"""
+Classificação das mudanças de estado de voz em transições
+"""
+from typing import Optional, Tuple
+import discord
+
+# Tipos de transição relevantes para o monitoramento
+DEAFENED = "deafened"              # Desativou o áudio no mesmo canal
+UNDEAFENED = "undeafened"          # Ativou o áudio (no mesmo canal ou ao mudar de canal)
+MOVED_DEAFENED = "moved_deafened"  # Mudou de canal com áudio desativado
+JOINED_DEAFENED = "joined_deafened"  # Entrou em um canal com áudio desativado
+LEFT = "left"                      # Saiu do canal de voz
+
+TRANSITION_KINDS = (DEAFENED, UNDEAFENED, MOVED_DEAFENED, JOINED_DEAFENED, LEFT)
+
+# Transições que cancelam timers (prioritárias) e que armam timers
+CANCELLING_KINDS = frozenset((UNDEAFENED, LEFT))
+ARMING_KINDS = frozenset((DEAFENED, MOVED_DEAFENED, JOINED_DEAFENED))
+
+def classify_transition(
+    before: discord.VoiceState,
+    after: discord.VoiceState
+) -> Optional[Tuple[str, Optional[discord.VoiceChannel]]]:
+    """
+    Classifica a diferença entre dois estados de voz em uma única passada
+
+    Mudanças que não afetam o monitoramento (self_mute, self_video, self_stream,
+    entrar ou mudar de canal com áudio ativado) retornam None imediatamente.
+
+    Args:
+        before: Estado anterior
+        after: Estado atual
+
+    Returns:
+        Tupla (tipo de transição, canal relevante) ou None se a mudança for irrelevante
+    """
+    before_channel = before.channel
+    after_channel = after.channel
+    before_id = before_channel.id if before_channel is not None else None
+    after_id = after_channel.id if after_channel is not None else None
+    was_deaf = before.self_deaf
+    is_deaf = after.self_deaf
+
+    # Filtro rápido: mesmo canal e mesmo estado de áudio
+    if before_id == after_id and was_deaf == is_deaf:
+        return None
+
+    if after_id is None:
+        if before_id is None:
+            return None
+        return LEFT, before_channel
+
+    if before_id is None:
+        return (JOINED_DEAFENED, after_channel) if is_deaf else None
+
+    if before_id != after_id:
+        if is_deaf:
+            return MOVED_DEAFENED, after_channel
+        return (UNDEAFENED, after_channel) if was_deaf else None
+
+    return (DEAFENED, after_channel) if is_deaf else (UNDEAFENED, after_channel)
+
+def benchmark_classify(iterations: int = 200_000) -> float:
+    """
+    Mede quantos eventos por segundo o classificador processa
+
+    Args:
+        iterations: Número de eventos simulados
+
+    Returns:
+        Eventos por segundo
+    """
+    import time
+    from types import SimpleNamespace
+
+    channel_a = SimpleNamespace(id=1)
+    channel_b = SimpleNamespace(id=2)
+
+    def state(channel, deaf, mute=False):
+        return SimpleNamespace(channel=channel, self_deaf=deaf, self_mute=mute)
+
+    # Mistura típica: maioria de mudanças irrelevantes (mute/vídeo/stream)
+    samples = [
+        (state(channel_a, False), state(channel_a, False, True)),
+        (state(channel_a, False, True), state(channel_a, False)),
+        (state(channel_a, False), state(channel_a, False)),
+        (state(channel_a, False), state(channel_a, True)),
+        (state(channel_a, True), state(channel_a, False)),
+        (state(channel_a, True), state(channel_b, True)),
+        (state(None, False), state(channel_a, True)),
+        (state(channel_a, False), state(None, False)),
+    ]
+
+    count = len(samples)
+    started = time.perf_counter()
+    for i in range(iterations):
+        before, after = samples[i % count]
+        classify_transition(before, after)
+    elapsed = time.perf_counter() - started
+
+    return iterations / elapsed
@@ -0,0 +1,215 @@
+"""
+Backfill de estatísticas a partir de arquivos bot.log históricos
+
+Lê os logs em blocos via mmap (memória constante), processa os blocos em paralelo
+e grava os agregados em formato colunar (JSON, opcionalmente comprimido com gzip).
+
+Uso:
+    python -m src.utils.log_backfill bot.log bot.log.1 --output stats.json.gz
+"""
+import argparse
+import gzip
+import json
+import mmap
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Formato de setup_logging: '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LINE_PATTERN = re.compile(
+    r"^(?P<date>\d{4}-\d{2}-\d{2}) [\d:,]+ - (?P<logger>[\w.]+) - (?P<level>\w+) - (?P<message>.*)$"
+)
+
+# Só as linhas dos serviços interessam; filtro em bytes antes de decodificar
+LINE_FILTER = b" - src.services."
+
+EVENT_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    ("deafen", re.compile(r"^🔇 (?P<user>.+) desativou o áudio no canal (?P<channel>.+)$")),
+    ("undeafen", re.compile(r"^🔊 (?P<user>.+) ativou o áudio$")),
+    ("moved_deafened", re.compile(r"^🔄 (?P<user>.+) mudou para (?P<channel>.+) com áudio desativado$")),
+    ("return_muted", re.compile(r"^🔄 (?P<user>.+) retornou ao canal (?P<channel>.+) mutado \(timeout")),
+    ("join_muted", re.compile(r"^🚪 (?P<user>.+) entrou no canal (?P<channel>.+) com áudio já desativado$")),
+    ("moved", re.compile(r"^🔄 (?P<user>.+) foi movido de '(?P<channel>.*)' para '.*' por ficar")),
+    ("disconnected", re.compile(r"^🚪 (?P<user>.+) foi removido do canal '(?P<channel>.*)' por ficar")),
+    ("move_error", re.compile(r"^❌ Erro ao mover usuário (?P<user>.+) para canal AFK")),
+]
+
+StatsKey = Tuple[str, str]
+
+class BackfillStats:
+    """Agregados por canal, usuário e dia"""
+
+    def __init__(self):
+        self.by_channel: Counter = Counter()  # (canal, evento) -> total
+        self.by_user: Counter = Counter()     # (usuário, evento) -> total
+        self.by_day: Counter = Counter()      # (dia, evento) -> total
+        self.lines = 0
+        self.matched = 0
+
+    def add(self, date: str, event: str, user: str, channel: Optional[str]) -> None:
+        """Contabiliza um evento"""
+        self.matched += 1
+        self.by_user[(user, event)] += 1
+        self.by_day[(date, event)] += 1
+        if channel is not None:
+            self.by_channel[(channel, event)] += 1
+
+    def merge(self, other: "BackfillStats") -> None:
+        """Soma os agregados de outro bloco"""
+        self.by_channel.update(other.by_channel)
+        self.by_user.update(other.by_user)
+        self.by_day.update(other.by_day)
+        self.lines += other.lines
+        self.matched += other.matched
+
+    def to_columnar(self) -> dict:
+        """
+        Converte os agregados em tabelas colunares
+
+        Returns:
+            Dicionário tabela -> {coluna: valores}
+        """
+        def table(counter: Counter, key_name: str) -> Dict[str, list]:
+            rows = sorted(counter.items())
+            return {
+                key_name: [key for (key, _), _ in rows],
+                "event": [event for (_, event), _ in rows],
+                "count": [count for _, count in rows]
+            }
+
+        return {
+            "summary": {"lines": self.lines, "matched": self.matched},
+            "channels": table(self.by_channel, "channel"),
+            "users": table(self.by_user, "user"),
+            "days": table(self.by_day, "day")
+        }
+
+def parse_line(raw: bytes, stats: BackfillStats) -> None:
+    """
+    Processa uma linha do log
+
+    Args:
+        raw: Linha em bytes
+        stats: Agregados a serem atualizados
+    """
+    stats.lines += 1
+    if LINE_FILTER not in raw:
+        return
+
+    match = LINE_PATTERN.match(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+    if match is None:
+        return
+
+    message = match.group("message")
+    for event, pattern in EVENT_PATTERNS:
+        event_match = pattern.match(message)
+        if event_match is not None:
+            fields = event_match.groupdict()
+            stats.add(match.group("date"), event, fields["user"], fields.get("channel"))
+            return
+
+def split_chunks(path: str, chunk_size: int) -> Iterator[Tuple[str, int, int]]:
+    """
+    Divide um arquivo em intervalos de bytes
+
+    Args:
+        path: Caminho do arquivo
+        chunk_size: Tamanho aproximado de cada bloco em bytes
+
+    Returns:
+        Iterador de (caminho, início, fim)
+    """
+    size = os.path.getsize(path)
+    for start in range(0, size, chunk_size):
+        yield path, start, min(start + chunk_size, size)
+
+def process_chunk(path: str, start: int, end: int) -> BackfillStats:
+    """
+    Processa as linhas que começam dentro do intervalo [start, end)
+
+    Args:
+        path: Caminho do arquivo
+        start: Byte inicial
+        end: Byte final
+
+    Returns:
+        Agregados do bloco
+    """
+    stats = BackfillStats()
+
+    with open(path, "rb") as log_file:
+        if os.fstat(log_file.fileno()).st_size == 0:
+            return stats
+
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            position = start
+            if start > 0 and data[start - 1:start] != b"\n":
+                # A linha parcial pertence ao bloco anterior
+                newline = data.find(b"\n", start)
+                position = len(data) if newline == -1 else newline + 1
+
+            data.seek(position)
+            while data.tell() < end:
+                line = data.readline()
+                if not line:
+                    break
+                parse_line(line, stats)
+
+    return stats
+
+def backfill(paths: List[str], workers: Optional[int] = None, chunk_size: int = 64 * 1024 * 1024) -> BackfillStats:
+    """
+    Processa vários arquivos de log em paralelo
+
+    Args:
+        paths: Arquivos de log
+        workers: Número de processos (None usa o número de CPUs)
+        chunk_size: Tamanho de cada bloco em bytes
+
+    Returns:
+        Agregados de todos os arquivos
+    """
+    chunks = [chunk for path in paths for chunk in split_chunks(path, chunk_size)]
+    total = BackfillStats()
+
+    if not chunks:
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_chunk, *chunk) for chunk in chunks]
+        for future in futures:
+            total.merge(future.result())
+
+    return total
+
+def write_output(stats: BackfillStats, output: str) -> None:
+    """
+    Grava os agregados em JSON colunar (gzip se o caminho terminar em .gz)
+
+    Args:
+        stats: Agregados
+        output: Caminho do arquivo de saída
+    """
+    opener = gzip.open if output.endswith(".gz") else open
+    with opener(output, "wt", encoding="utf-8") as output_file:
+        json.dump(stats.to_columnar(), output_file, ensure_ascii=False, separators=(",", ":"))
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Gera estatísticas históricas a partir de arquivos bot.log")
+    parser.add_argument("paths", nargs="+", help="Arquivos de log")
+    parser.add_argument("--output", default="log_stats.json.gz", help="Arquivo de saída (JSON colunar, .gz comprime)")
+    parser.add_argument("--workers", type=int, default=None, help="Número de processos")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Tamanho de cada bloco em MB")
+    args = parser.parse_args(argv)
+
+    stats = backfill(args.paths, workers=args.workers, chunk_size=args.chunk_size * 1024 * 1024)
+    write_output(stats, args.output)
+
+    print(f"📊 {stats.lines} linhas lidas, {stats.matched} eventos contabilizados")
+    print(f"💾 Estatísticas gravadas em {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Medição das fases de inicialização do bot
+"""
+import json
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class StartupTimer:
+    """Registra o tempo de cada fase da inicialização (import, login, ready, reconciliação)"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.first_enforcement: Optional[float] = None
+        self.reported = False
+
+    def has_phase(self, phase: str) -> bool:
+        """
+        Verifica se uma fase já foi concluída
+
+        Args:
+            phase: Nome da fase
+
+        Returns:
+            True se a fase já foi marcada
+        """
+        return any(name == phase for name, _ in self.phases)
+
+    def mark(self, phase: str) -> None:
+        """
+        Marca o fim de uma fase
+
+        Args:
+            phase: Nome da fase
+        """
+        if self.has_phase(phase):
+            return
+        self.phases.append((phase, time.perf_counter()))
+
+    def mark_first_enforcement(self) -> None:
+        """Marca a primeira movimentação feita pelo bot após iniciar"""
+        if self.first_enforcement is not None:
+            return
+        self.first_enforcement = time.perf_counter()
+        logger.info(f"⏱️ Primeira ação de monitoramento {self.first_enforcement - self.started_at:.3f}s após o início")
+
+    def get_breakdown(self) -> Dict[str, float]:
+        """
+        Retorna a duração de cada fase em segundos
+
+        Returns:
+            Dicionário fase -> duração
+        """
+        breakdown = {}
+        previous = self.started_at
+        for phase, timestamp in self.phases:
+            breakdown[phase] = timestamp - previous
+            previous = timestamp
+        breakdown["total"] = previous - self.started_at
+        if self.first_enforcement is not None:
+            breakdown["first_enforcement"] = self.first_enforcement - self.started_at
+        return breakdown
+
+    def report(self) -> None:
+        """Registra no log o detalhamento da inicialização (apenas uma vez)"""
+        if self.reported:
+            return
+        self.reported = True
+
+        details = ", ".join(
+            f"{phase}: {duration:.3f}s" for phase, duration in self.get_breakdown().items()
+        )
+        logger.info(f"⏱️ Tempo de inicialização - {details}")
+
+    def save(self, path: str, status: str = "ok") -> None:
+        """
+        Acrescenta o detalhamento da inicialização a um arquivo JSONL
+
+        Args:
+            path: Caminho do arquivo
+            status: Situação da medição ("ok" ou o motivo da falha)
+        """
+        from .. import __version__
+
+        record = {
+            "version": __version__,
+            "timestamp": time.time(),
+            "status": status,
+            "phases": self.get_breakdown()
+        }
+        with open(path, "a", encoding="utf-8") as output:
+            output.write(json.dumps(record) + "\n")
+
+        if status != "ok":
+            logger.error(f"❌ Benchmark de inicialização falhou ({status}), resultado gravado em {path}")
+            return
+
+        first = record["phases"].get("first_enforcement")
+        first_text = f"{first:.3f}s" if first is not None else "nenhuma movimentação no período"
+        logger.info(f"⏱️ Benchmark de inicialização gravado em {path} (primeira ação: {first_text})")
+
+startup_timer = StartupTimer()
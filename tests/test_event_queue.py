@@ -0,0 +1,106 @@
+"""
+Testes da fila de ingestão de eventos de voz
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+from src.services.event_queue import VoiceEventQueue
+from src.services.voice_monitor import VoiceMonitor
+
+GUILD_A = SimpleNamespace(id=1, name="A")
+GUILD_B = SimpleNamespace(id=2, name="B")
+CHANNEL_A = SimpleNamespace(id=10, name="geral", guild=GUILD_A)
+CHANNEL_B = SimpleNamespace(id=20, name="geral", guild=GUILD_B)
+
+def member(member_id, guild):
+    return SimpleNamespace(id=member_id, name=f"user{member_id}", guild=guild, voice=None)
+
+def voice_state(channel, self_deaf):
+    return SimpleNamespace(channel=channel, self_deaf=self_deaf, deaf=False, self_mute=False, mute=False)
+
+async def drain(queue):
+    for _ in range(1000):
+        if not queue.get_stats()["depth"] and not queue.guild_queues:
+            return
+        await asyncio.sleep(0)
+
+def test_stale_leave_from_other_guild_does_not_cancel_newer_timer():
+    async def scenario():
+        monitor = VoiceMonitor()
+        monitor.monitored_channels = []
+        queue = VoiceEventQueue(monitor, workers=2, max_size=1000)
+
+        # Guild A acumula eventos pendentes antes da saída do membro 7
+        for member_id in range(100, 150):
+            queue.submit(member(member_id, GUILD_A), voice_state(CHANNEL_A, True), voice_state(CHANNEL_A, False))
+
+        # Membro 7 sai de A e entra em B já com áudio desativado
+        queue.submit(member(7, GUILD_A), voice_state(CHANNEL_A, False), voice_state(None, False))
+        queue.submit(member(7, GUILD_B), voice_state(None, False), voice_state(CHANNEL_B, True))
+
+        queue.start()
+        await drain(queue)
+
+        try:
+            assert monitor.user_manager.is_user_muted(7)
+            assert monitor.user_manager.task_guilds[7] == GUILD_B.id
+        finally:
+            queue.stop()
+            monitor.shutdown()
+
+    asyncio.run(scenario())
+
+def test_stale_leave_does_not_track_member_who_already_returned():
+    async def scenario():
+        monitor = VoiceMonitor()
+        monitor.monitored_channels = []
+        subscriber = monitor.event_hub.subscribe()
+        queue = VoiceEventQueue(monitor, workers=2, max_size=1000)
+
+        for member_id in range(100, 150):
+            queue.submit(member(member_id, GUILD_A), voice_state(CHANNEL_A, True), voice_state(CHANNEL_A, False))
+
+        queue.submit(member(7, GUILD_A), voice_state(CHANNEL_A, False), voice_state(None, False))
+        queue.submit(member(7, GUILD_B), voice_state(None, False), voice_state(CHANNEL_B, True))
+
+        queue.start()
+        await drain(queue)
+
+        try:
+            armed = [
+                event for event in map(json.loads, subscriber.drain())
+                if event["type"] == "timer_armed" and event["member_id"] == 7
+            ]
+            # Mesmo resultado do processamento em linha: a volta usa o timeout de retorno
+            assert [event["join_type"] for event in armed] == ["return_muted"]
+            assert [event["guild_id"] for event in armed] == [GUILD_B.id]
+            # A saída processada depois da volta não recria o rastreamento
+            assert 7 not in monitor.users_left_monitored_channels
+        finally:
+            queue.stop()
+            monitor.shutdown()
+
+    asyncio.run(scenario())
+
+def test_leave_in_same_guild_cancels_timer():
+    async def scenario():
+        monitor = VoiceMonitor()
+        monitor.monitored_channels = []
+        queue = VoiceEventQueue(monitor, workers=1, max_size=1000)
+
+        queue.submit(member(7, GUILD_A), voice_state(None, False), voice_state(CHANNEL_A, True))
+        queue.start()
+        await drain(queue)
+        assert monitor.user_manager.is_user_muted(7)
+
+        queue.submit(member(7, GUILD_A), voice_state(CHANNEL_A, True), voice_state(None, False))
+        await drain(queue)
+
+        try:
+            assert not monitor.user_manager.is_user_muted(7)
+        finally:
+            queue.stop()
+            monitor.shutdown()
+
+    asyncio.run(scenario())
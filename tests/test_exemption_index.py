@@ -0,0 +1,53 @@
+"""
+Testes do índice de membros isentos do monitoramento
+"""
+from types import SimpleNamespace
+
+from src.services.exemption_index import ExemptionIndex, parse_exemption_rules
+
+GUILD_ID = 1
+STAFF = SimpleNamespace(id=500, name="Staff", members=[])
+EVERYONE = SimpleNamespace(id=501, name="everyone", members=[])
+
+def member(member_id, roles=()):
+    return SimpleNamespace(id=member_id, guild=SimpleNamespace(id=GUILD_ID), roles=list(roles))
+
+def build_index():
+    STAFF.members = [member(7, [STAFF])]
+    guild = SimpleNamespace(id=GUILD_ID, name="A", roles=[EVERYONE, STAFF])
+    index = ExemptionIndex(parse_exemption_rules(["staff"]), parse_exemption_rules(["42"]))
+    index.rebuild(guild)
+    return index
+
+def test_user_exempt_by_id_survives_leaving_and_rejoining():
+    index = build_index()
+    assert index.is_exempt(GUILD_ID, 42)
+
+    index.remove_member(member(42))
+    assert index.is_exempt(GUILD_ID, 42)
+
+    # Voltou sem cargos: a atualização de cargos também não remove a isenção por ID
+    assert index.update_member(member(42))
+    assert index.is_exempt(GUILD_ID, 42)
+
+def test_role_exemption_follows_member_roles():
+    index = build_index()
+    assert index.is_exempt(GUILD_ID, 7)
+
+    assert not index.update_member(member(7, [EVERYONE]))
+    assert not index.is_exempt(GUILD_ID, 7)
+
+    assert index.update_member(member(7, [STAFF]))
+    index.remove_member(member(7))
+    assert not index.is_exempt(GUILD_ID, 7)
+
+def test_guild_scoped_rules():
+    rules = parse_exemption_rules(["2:42", "99"])
+    index = ExemptionIndex([], rules)
+
+    index.rebuild(SimpleNamespace(id=1, name="A", roles=[]))
+    index.rebuild(SimpleNamespace(id=2, name="B", roles=[]))
+
+    assert not index.is_exempt(1, 42)
+    assert index.is_exempt(2, 42)
+    assert index.is_exempt(1, 99) and index.is_exempt(2, 99)
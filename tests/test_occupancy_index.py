@@ -0,0 +1,94 @@
+"""
+Testes do índice incremental de ocupação dos canais de voz
+"""
+from types import SimpleNamespace
+
+from src.services.occupancy_index import VoiceOccupancyIndex
+
+GUILD_A = SimpleNamespace(id=1, name="A")
+GUILD_B = SimpleNamespace(id=2, name="B")
+CHANNEL_A1 = SimpleNamespace(id=10, name="geral", guild=GUILD_A)
+CHANNEL_A2 = SimpleNamespace(id=11, name="jogos", guild=GUILD_A)
+CHANNEL_B = SimpleNamespace(id=20, name="geral", guild=GUILD_B)
+
+def voice_state(channel, self_deaf=False, deaf=False, self_mute=False, mute=False):
+    return SimpleNamespace(channel=channel, self_deaf=self_deaf, deaf=deaf, self_mute=self_mute, mute=mute)
+
+def member(member_id, voice):
+    return SimpleNamespace(id=member_id, voice=voice)
+
+def counts(index, channel):
+    occupancy = index.get(channel.id)
+    return occupancy.as_dict() if occupancy else None
+
+def test_update_counts_join_change_and_leave():
+    index = VoiceOccupancyIndex()
+
+    index.update(1, voice_state(CHANNEL_A1))
+    index.update(2, voice_state(CHANNEL_A1, self_deaf=True, self_mute=True))
+    assert counts(index, CHANNEL_A1) == {"total": 2, "deafened": 1, "muted": 1}
+    assert index.listening_count(CHANNEL_A1.id) == 1
+
+    # Mudar de canal desconta do anterior
+    index.update(2, voice_state(CHANNEL_A2, self_deaf=True))
+    assert counts(index, CHANNEL_A1) == {"total": 1, "deafened": 0, "muted": 0}
+    assert counts(index, CHANNEL_A2) == {"total": 1, "deafened": 1, "muted": 0}
+
+    # Canal vazio é removido do índice
+    index.update(1, voice_state(None))
+    assert index.get(CHANNEL_A1.id) is None
+    assert 1 not in index.members
+
+def test_server_deafen_counts_as_deafened():
+    index = VoiceOccupancyIndex()
+
+    index.update(1, voice_state(CHANNEL_A1, deaf=True))
+    index.update(2, voice_state(CHANNEL_A1, mute=True))
+
+    assert counts(index, CHANNEL_A1) == {"total": 2, "deafened": 1, "muted": 1}
+    assert index.listening_count(CHANNEL_A1.id) == 1
+    assert index.get_deafened_since(1) is not None
+    assert index.get_deafened_since(2) is None
+
+def test_repeated_state_is_counted_once():
+    index = VoiceOccupancyIndex()
+
+    index.update(1, voice_state(CHANNEL_A1, self_deaf=True))
+    since = index.get_deafened_since(1)
+    index.update(1, voice_state(CHANNEL_A1, self_deaf=True))
+    index.update(1, voice_state(CHANNEL_A1, self_deaf=True, self_mute=True))
+
+    assert counts(index, CHANNEL_A1) == {"total": 1, "deafened": 1, "muted": 1}
+    assert index.get_deafened_since(1) == since
+
+def test_rebuild_replaces_guild_entries_only():
+    index = VoiceOccupancyIndex()
+    index.update(1, voice_state(CHANNEL_A1))
+    index.update(2, voice_state(SimpleNamespace(id=99, name="removido", guild=GUILD_A), self_deaf=True))
+    index.update(3, voice_state(CHANNEL_B))
+
+    stage = SimpleNamespace(id=12, name="palco", guild=GUILD_A)
+    stage.members = [member(4, voice_state(stage, self_deaf=True))]
+    voice = SimpleNamespace(id=CHANNEL_A1.id, name="geral", guild=GUILD_A)
+    voice.members = [member(1, voice_state(voice, self_mute=True))]
+    guild = SimpleNamespace(id=GUILD_A.id, name="A", voice_channels=[voice], stage_channels=[stage])
+
+    index.rebuild(guild)
+
+    assert counts(index, CHANNEL_A1) == {"total": 1, "deafened": 0, "muted": 1}
+    assert counts(index, stage) == {"total": 1, "deafened": 1, "muted": 0}
+    assert index.get(99) is None
+    assert 2 not in index.members and 2 not in index.deafened_since
+    assert counts(index, CHANNEL_B) == {"total": 1, "deafened": 0, "muted": 0}
+
+def test_remove_guild_purges_members_and_channels():
+    index = VoiceOccupancyIndex()
+    index.update(1, voice_state(CHANNEL_A1, self_deaf=True))
+    index.update(2, voice_state(CHANNEL_A2))
+    index.update(3, voice_state(CHANNEL_B, self_deaf=True))
+
+    index.remove_guild(GUILD_A.id)
+
+    assert set(index.members) == {3}
+    assert set(index.channels) == {CHANNEL_B.id}
+    assert set(index.deafened_since) == {3}
@@ -0,0 +1,106 @@
+"""
+Testes do classificador de transições de estado de voz e do UserManager
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.user_manager import UserManager
+from src.services.voice_transitions import (
+    DEAFENED, JOINED_DEAFENED, LEFT, MOVED_DEAFENED, UNDEAFENED, classify_transition
+)
+
+CHANNEL_A = SimpleNamespace(id=1, name="a")
+CHANNEL_B = SimpleNamespace(id=2, name="b")
+CHANNELS = {None: None, "A": CHANNEL_A, "B": CHANNEL_B}
+
+def voice_state(channel, self_deaf, self_mute=False, self_video=False, self_stream=False):
+    return SimpleNamespace(
+        channel=CHANNELS[channel],
+        self_deaf=self_deaf,
+        self_mute=self_mute,
+        self_video=self_video,
+        self_stream=self_stream
+    )
+
+# (canal antes, áudio desativado antes, canal depois, áudio desativado depois) -> (tipo, canal) ou None
+TRANSITION_MATRIX = [
+    # Fora de canal -> fora de canal
+    (None, False, None, False, None),
+    (None, False, None, True, None),
+    (None, True, None, False, None),
+    (None, True, None, True, None),
+    # Entrando em um canal
+    (None, False, "A", False, None),
+    (None, False, "A", True, (JOINED_DEAFENED, "A")),
+    (None, True, "A", False, None),
+    (None, True, "A", True, (JOINED_DEAFENED, "A")),
+    (None, False, "B", False, None),
+    (None, False, "B", True, (JOINED_DEAFENED, "B")),
+    (None, True, "B", False, None),
+    (None, True, "B", True, (JOINED_DEAFENED, "B")),
+    # Saindo do canal
+    ("A", False, None, False, (LEFT, "A")),
+    ("A", False, None, True, (LEFT, "A")),
+    ("A", True, None, False, (LEFT, "A")),
+    ("A", True, None, True, (LEFT, "A")),
+    # Permanecendo no mesmo canal
+    ("A", False, "A", False, None),
+    ("A", False, "A", True, (DEAFENED, "A")),
+    ("A", True, "A", False, (UNDEAFENED, "A")),
+    ("A", True, "A", True, None),
+    # Mudando de canal
+    ("A", False, "B", False, None),
+    ("A", False, "B", True, (MOVED_DEAFENED, "B")),
+    ("A", True, "B", False, (UNDEAFENED, "B")),
+    ("A", True, "B", True, (MOVED_DEAFENED, "B")),
+]
+
+@pytest.mark.parametrize("before_channel,before_deaf,after_channel,after_deaf,expected", TRANSITION_MATRIX)
+def test_classify_transition_matrix(before_channel, before_deaf, after_channel, after_deaf, expected):
+    before = voice_state(before_channel, before_deaf)
+    after = voice_state(after_channel, after_deaf)
+
+    result = classify_transition(before, after)
+
+    if expected is None:
+        assert result is None
+    else:
+        kind, channel = expected
+        assert result == (kind, CHANNELS[channel])
+
+@pytest.mark.parametrize("flag", ["self_mute", "self_video", "self_stream"])
+@pytest.mark.parametrize("deaf", [False, True])
+def test_classify_transition_ignores_irrelevant_flags(flag, deaf):
+    before = voice_state("A", deaf)
+    after = voice_state("A", deaf, **{flag: True})
+
+    assert classify_transition(before, after) is None
+    assert classify_transition(after, before) is None
+
+def test_classify_transition_compares_channels_by_id():
+    before = SimpleNamespace(channel=SimpleNamespace(id=1), self_deaf=False)
+    after = SimpleNamespace(channel=SimpleNamespace(id=1), self_deaf=True)
+
+    assert classify_transition(before, after) == (DEAFENED, after.channel)
+
+def test_discard_task_keeps_newer_task():
+    async def scenario():
+        manager = UserManager()
+        old_task = asyncio.create_task(asyncio.sleep(10))
+        new_task = asyncio.create_task(asyncio.sleep(10))
+
+        manager.add_muted_user(7, old_task)
+        manager.add_muted_user(7, new_task)
+        manager.discard_task(7, old_task)
+
+        assert manager.muted_users.get(7) is new_task
+        assert not new_task.cancelled()
+
+        manager.discard_task(7, new_task)
+        assert not manager.is_user_muted(7)
+
+        new_task.cancel()
+
+    asyncio.run(scenario())